@@ -1,13 +1,20 @@
 import bpy
-from bpy.props import BoolProperty
+from bpy.props import BoolProperty, StringProperty, EnumProperty
 import mathutils
+import mathutils.kdtree
+import csv
+import io
+import json
 import math
+import os
 import random
+import re
 from mathutils import Matrix, Euler
+from bpy_extras.io_utils import ExportHelper
 
 bl_info = {
     "name": "Linked Collection Toolbox",
-    "blender": (2, 80, 0),
+    "blender": (3, 6, 0),
     "category": "Object",
 }
 
@@ -28,6 +35,7 @@ LINKED COLLECTION TOOLBOX
         - Looks for linked collections based on the currently selected object
         - Checks if any of the linked collections are missing the object from the current collection
         - Copies the missing object or all missing objects over to all linked collections, matching its respective location (scale and rotation are curently not matched due to cluelessness)
+        - Without a selected reference object, the nearest object of the collection that also exists in the linked collection is used as reference (found via a KD-tree)
 
     Tool 3: REMOVE OBJECT
         - Looks for linked collections based on the currently selected object
@@ -37,6 +45,37 @@ LINKED COLLECTION TOOLBOX
         - Select all objects in collection
         - Set active collection based on selected object
 
+    Tool 5: LIBRARY LINK GROUPS
+        - Links a collection from an external library .blend file as the original of a Link Group
+        - Creates (Linked) copies of it as library overrides, so the object data stays in the library file
+        - Syncs the linked copies against the current version of the library (reloading it when the file has changed)
+        - The contents of library files are cached by path and modification time, so the file is only read again after it changed
+
+    Tool 6: AUDIT LINK GROUPS
+        - Checks all Link Groups in a single pass over their objects
+        - Reports missing, extra, diverged (made single-user) and duplicate objects, empty collections and naming issues, as well as (Original) and (Linked) collections outside of a Link Group
+        - Shows a summary in the panel and writes the full report as JSON to the "Link Group Audit.json" text
+
+    Tool 7: LINK GROUP BROWSER
+        - Lists all Link Groups with their number of collections and objects and their sync status, with filtering and sorting
+        - The list is drawn from a cached summary, which is only updated for the Link Groups whose collections changed
+        - Select the counterparts of the selected objects in all linked collections
+        - Jump to the Link Group selected in the list
+
+    Tool 8: OVERRIDE LAYERS
+        - Stores the differences of objects in a linked collection to their originals (object-linked materials, modifier toggles, visibility) on the linked collection
+        - The overrides are applied again whenever objects are synced, so linked collections can vary without making the object data single-user
+
+    Tool 9: VIEWPORT CULLING
+        - Disables linked collections (or displays them as bounds) when they are further away from the view than a set distance, or outside of the view
+        - Uses cached bounding boxes per linked collection, which are only recalculated after their objects moved, and updates on a timer instead of every redraw
+        - Restores the previous state when disabled (and before saving), without touching the objects' own "Disable in Viewport" flags
+
+    Tool 10: MEMORY ACCOUNTING
+        - Estimates the memory of each Link Group and the whole file: objects, unique data-blocks and bytes of vertices, polygons, attributes and modifier results
+        - Separates data shared between linked objects from data duplicated by single-user copies
+        - Estimates are calculated from the array sizes, without reading the data, and can be exported as CSV
+
 
     KNOWN ISSUES:
     - When all objects from the linked collection have been removed, the sync doesn't work anymore (there are no reference objects).
@@ -49,6 +88,14 @@ bpy.types.Scene.unhide_objects = BoolProperty(
         description="After creating a linked collection, any objects that were hidden from the viewport will be made visible again, so they can be moved with the selection",
         default = False)
 
+# Naming and color coding of the collections making up a Link Group
+link_group_name_suffix = "(Link Group)"
+linked_collection_name_suffix = "(Linked)"
+original_collection_name_suffix = "(Original)"
+original_collection_color_tag = 'COLOR_02'
+linked_collection_color_tag = 'COLOR_03'
+link_group_collection_color_tag = 'COLOR_04'
+
 #########################################
 
 # TOOL 1: CREATE LINKED COLLECTION
@@ -85,13 +132,6 @@ class CreateLinkedCollectionOperator(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        link_group_name_suffix = "(Link Group)"
-        linked_collection_name_suffix = "(Linked)"
-        original_collection_name_suffix = "(Original)"
-        original_collection_color_tag = 'COLOR_02'
-        linked_collection_color_tag = 'COLOR_03'
-        link_group_collection_color_tag = 'COLOR_04'
-
         # what collection is the active scene collection?
         #selected_collection = bpy.context.view_layer.active_layer_collection.collection
 
@@ -206,6 +246,35 @@ def display_message(message, type='INFO'):
     bpy.context.window_manager.popup_menu(draw, title=f"{type.capitalize()} Message", icon=type)
 
 
+# Helper function to map the object data of a collection's objects to the objects, for looking up counterparts of objects in other collections
+def get_counterparts_by_data(collection):
+    counterparts_by_data = {}
+    for obj in collection.objects:
+        counterparts_by_data.setdefault(obj.data, obj)
+    return counterparts_by_data
+
+# Helper class to find the reference object for placing a synced object in a linked collection
+# Builds a KD-tree over the locations of the objects once, so finding the nearest one is O(log n) instead of trying every object
+class NearestReferenceFinder:
+    def __init__(self, objects):
+        # objects without data (e.g. empties) can't be matched to their counterparts, so they can't be used as reference
+        self.objects = [obj for obj in objects if obj.data]
+        self.kd = mathutils.kdtree.KDTree(len(self.objects))
+        for index, obj in enumerate(self.objects):
+            self.kd.insert(obj.location, index)
+        self.kd.balance()
+
+    # Find the object nearest to location that has a counterpart in counterparts_by_data
+    # Objects using exclude_data are skipped, so the object being synced (or a duplicate of it) is never its own reference
+    def find(self, location, counterparts_by_data, exclude_data=None):
+        if not self.objects:
+            return None
+        co, index, distance = self.kd.find(location, filter=lambda index: self.objects[index].data in counterparts_by_data and self.objects[index].data != exclude_data)
+        if index is None:
+            return None
+        return self.objects[index]
+
+
 class SyncObjectsOperator(bpy.types.Operator):
     bl_idname = "object.sync_objects_operator"
     bl_label = "Sync Objects"
@@ -219,8 +288,9 @@ class SyncObjectsOperator(bpy.types.Operator):
         
         new_obj = active_object.copy()
         linked_collection.objects.link(new_obj)
+        apply_link_overrides(linked_collection, [new_obj])
 
-        # a specific reference object was not selected, so use the original reference object
+        # a specific reference object was not selected, so use the nearest reference object found for this linked collection
         if not ref_obj_selected:
             linked_reference_obj = next((linked_obj for linked_obj in linked_objects if linked_obj.data == reference_obj.data), None)
             offset_selected_to_linked = linked_reference_obj.location - reference_obj.location
@@ -388,26 +458,20 @@ class SyncObjectsOperator(bpy.types.Operator):
             else:
                 # Check if any linked collections related to this collection exist
                 for collection in bpy.data.collections:
+                    # collections linked from a library are read-only, they are synced via "Sync from Library" instead
+                    if collection.library:
+                        continue
                     if any(linked_obj.data == selected_obj.data for linked_obj in collection.objects for selected_obj in selected_collection.objects if selected_obj.original):
                         linked_collections.append(collection)
 
             ### DO SOME CLEAN UP FROM HERE ON ###
 
-            # Get reference object from the linked collection ## Should rename this, its super confusing
-            reference_obj = None
-            for obj in selected_collection.objects:
-                if obj.original:
-                    missing_in_linked_collections = []
-                    for linked_collection in linked_collections:
-                        linked_objects = set(linked_collection.objects)
-                        found_in_linked_collections = any(linked_obj.data == obj.data and linked_obj != active_object for linked_obj in linked_objects)
-                        if not found_in_linked_collections:
-                            missing_in_linked_collections.append(linked_collection.name)
-                    if not missing_in_linked_collections:
-                        reference_obj = obj
-                        break
+            # Build a KD-tree over the objects of the original collection once, to find the nearest reference object for each linked collection
+            reference_finder = NearestReferenceFinder(obj for obj in selected_collection.objects if obj.original)
+            # Map the object data of each linked collection to its objects once, so counterparts can be looked up directly
+            counterparts_by_collection = {linked_collection: get_counterparts_by_data(linked_collection) for linked_collection in linked_collections}
 
-            if reference_obj:
+            if reference_finder.objects:
 
                 # If sync_all_objects is True, copy missing objects to linked collections
                 if self.sync_all_objects:
@@ -416,18 +480,19 @@ class SyncObjectsOperator(bpy.types.Operator):
                         if obj.original:
                             missing_in_linked_collections = []
                             for linked_collection in linked_collections:
-                                linked_objects = set(linked_collection.objects)
-                                found_in_linked_collections = any(linked_obj.data == obj.data for linked_obj in linked_objects)
-                                if not found_in_linked_collections:
+                                counterparts_by_data = counterparts_by_collection[linked_collection]
+                                if obj.data not in counterparts_by_data:
                                     missing_in_linked_collections.append(linked_collection.name)
                                     new_obj = obj.copy()
-                                    linked_reference_obj = next((linked_obj for linked_obj in linked_objects if linked_obj.data == reference_obj.data), None)
+                                    # use the nearest object that exists in the linked collection as reference
+                                    reference_obj = reference_finder.find(obj.location, counterparts_by_data, obj.data)
 
-                                    if linked_reference_obj:
-                                        offset_selected_to_linked = linked_reference_obj.location - reference_obj.location
+                                    if reference_obj:
+                                        offset_selected_to_linked = counterparts_by_data[reference_obj.data].location - reference_obj.location
                                         new_obj.location += offset_selected_to_linked
 
                                     linked_collection.objects.link(new_obj)
+                                    apply_link_overrides(linked_collection, [new_obj])
                             missing_objects.append((obj.name, missing_in_linked_collections))
                 else:
                     # If sync_all_objects is False, copy only the selected object to linked collections
@@ -447,8 +512,13 @@ class SyncObjectsOperator(bpy.types.Operator):
                     # check if the active object was found in any of the linked collections
                     for linked_collection in linked_collections:
                         linked_objects = set(linked_collection.objects)
-                        found_in_linked_collections = any(linked_obj.data == active_object.data for linked_obj in linked_objects)
-                        # get linked_obj data from linked_collections
+                        counterparts_by_data = counterparts_by_collection[linked_collection]
+                        found_in_linked_collections = active_object.data in counterparts_by_data
+
+                        # without a selected reference object, use the nearest object that exists in the linked collection as reference
+                        reference_obj = reference_finder.find(active_object.location, counterparts_by_data, active_object.data)
+                        if not reference_obj and not ref_obj_selected:
+                            continue
                         
                         if not found_in_linked_collections:
                             missing_in_linked_collections.append(linked_collection.name)
@@ -456,10 +526,10 @@ class SyncObjectsOperator(bpy.types.Operator):
                             self.handle_sync(context, active_object, linked_collection, linked_objects, reference_obj, ref_obj_selected)
                                 
                         else:
-                            linked_object = next((linked_obj for linked_obj in linked_objects if linked_obj.data == active_object.data), None)
+                            linked_object = counterparts_by_data[active_object.data]
                             
                             if ref_obj_selected:
-                                found_ref_obj_in_linked_collections = any(linked_obj.data == ref_obj_selected.data for linked_obj in linked_objects)
+                                found_ref_obj_in_linked_collections = ref_obj_selected.data in counterparts_by_data
                                 
                                 if found_ref_obj_in_linked_collections:
                                     self.handle_sync(context, active_object, linked_collection, linked_objects, reference_obj, ref_obj_selected)
@@ -513,6 +583,9 @@ class RemoveSelectedObjectOperator(bpy.types.Operator):
             
             linked_collections = []
             for collection in bpy.data.collections:
+                # collections linked from a library are read-only
+                if collection.library:
+                    continue
                 if any(linked_obj.data == selected_obj.data for linked_obj in collection.objects for selected_obj in selected_collection.objects if selected_obj.original):
                     # exclude the selected object's collection from the list of linked collections
                     if collection != selected_collection:
@@ -722,6 +795,1216 @@ class DisableSelectedInViewport(bpy.types.Operator):
     
 ####
 
+#########################################
+# Tool 5: LIBRARY LINK GROUPS
+
+# Cache of the collection names in library files, keyed by (absolute path, modification time) so a library file is only read again after it changed
+library_contents_cache = {}
+# Modification time of each library file when it was last loaded into the current file, keyed by absolute path
+# None if the library was loaded while the add-on wasn't enabled, so the version that was loaded is unknown
+library_load_mtimes = {}
+# Whether the libraries of the current file have been recorded, until then newly linked libraries can't be told apart from the others
+library_load_mtimes_initialized = False
+# Blender needs the items of a dynamic EnumProperty to stay referenced from Python, otherwise the names in the dropdown get garbled
+library_collection_enum_items = []
+
+# Helper function to get the normalized absolute path of a (possibly relative) .blend file path
+def get_library_abs_path(filepath):
+    return os.path.normpath(bpy.path.abspath(filepath))
+
+# Helper function to get the names of all collections in a library file, using the cache if the file hasn't changed since the last read
+def get_library_collection_names(filepath):
+    abs_path = get_library_abs_path(filepath)
+    if not os.path.isfile(abs_path):
+        return []
+
+    cache_key = (abs_path, os.path.getmtime(abs_path))
+    if cache_key not in library_contents_cache:
+        # Drop the entries of older versions of the same file
+        for stale_key in [key for key in library_contents_cache if key[0] == abs_path]:
+            del library_contents_cache[stale_key]
+        # Only read the names, nothing is linked as long as data_to stays empty
+        try:
+            with bpy.data.libraries.load(abs_path, link=True) as (data_from, data_to):
+                library_contents_cache[cache_key] = list(data_from.collections)
+        except OSError:
+            # not a readable .blend file, cached as well so it isn't tried again on every redraw
+            library_contents_cache[cache_key] = []
+
+    return library_contents_cache[cache_key]
+
+def library_collection_items(self, context):
+    library_collection_enum_items.clear()
+    for collection_name in get_library_collection_names(self.library_filepath):
+        library_collection_enum_items.append((collection_name, collection_name, ""))
+    return library_collection_enum_items
+
+bpy.types.Scene.library_filepath = StringProperty(
+    name="Library File",
+        description="The .blend file containing the master assets",
+        subtype='FILE_PATH',
+        default = "")
+
+bpy.types.Scene.library_collection = EnumProperty(
+    name="Library Collection",
+        description="The collection in the library file to create a linked collection from",
+        items=library_collection_items)
+
+# Record the modification times of all libraries whenever a file is loaded (Blender reads the libraries at that point)
+@bpy.app.handlers.persistent
+def record_library_mtimes(dummy):
+    global library_load_mtimes_initialized
+    library_load_mtimes_initialized = True
+    library_load_mtimes.clear()
+    for library in bpy.data.libraries:
+        abs_path = get_library_abs_path(library.filepath)
+        if os.path.isfile(abs_path):
+            library_load_mtimes[abs_path] = os.path.getmtime(abs_path)
+
+# Record the modification times of libraries linked since the last update (e.g. via File > Link), as they were just read
+@bpy.app.handlers.persistent
+def record_new_library_mtimes(scene, depsgraph):
+    if not library_load_mtimes_initialized or len(library_load_mtimes) >= len(bpy.data.libraries):
+        return
+    for library in bpy.data.libraries:
+        abs_path = get_library_abs_path(library.filepath)
+        if abs_path not in library_load_mtimes and os.path.isfile(abs_path):
+            library_load_mtimes[abs_path] = os.path.getmtime(abs_path)
+
+# Timer for when the add-on is enabled: the libraries of the current file were loaded before, so which version was loaded is unknown
+def mark_library_mtimes_unknown():
+    global library_load_mtimes_initialized
+    library_load_mtimes_initialized = True
+    for library in bpy.data.libraries:
+        library_load_mtimes.setdefault(get_library_abs_path(library.filepath), None)
+    return None
+
+# Helper function to get the Link Group a collection belongs to, if any
+def get_link_group(collection):
+    parent_collection, parent_collection_is_link_group = is_collection_within_parent_with_string(collection, link_group_name_suffix)
+    if parent_collection_is_link_group:
+        return parent_collection
+    return None
+
+# Helper function to get the collection of a Link Group that is linked from a library, if any
+def get_library_collection(link_group):
+    return next((child for child in link_group.children if child.library), None)
+
+# Helper function to reload the library of a collection if its file changed since it was loaded
+# Returns the collection again, since references to library data become invalid after a reload
+def reload_library_if_changed(library_collection):
+    library = library_collection.library
+    library_filepath = library.filepath
+    collection_name = library_collection.name
+    abs_path = get_library_abs_path(library_filepath)
+    if not os.path.isfile(abs_path):
+        return library_collection
+
+    # Reload if the file changed since it was loaded, or if it's unknown when it was loaded
+    mtime = os.path.getmtime(abs_path)
+    if library_load_mtimes.get(abs_path) != mtime:
+        library.reload()
+        library_load_mtimes[abs_path] = mtime
+        library_collection = bpy.data.collections.get((collection_name, library_filepath))
+
+    return library_collection
+
+# Helper function to sync a linked collection to the objects in the library version of its original collection
+def sync_collection_to_library(library_collection, linked_collection):
+    library_objects = list(library_collection.objects)
+    library_data = set(obj.data for obj in library_objects)
+    linked_objects_by_data = {obj.data: obj for obj in linked_collection.objects}
+
+    # Remove objects whose data has been removed from the library collection (objects added locally are kept)
+    for obj in list(linked_collection.objects):
+        if obj.data and obj.data.library == library_collection.library and obj.data not in library_data:
+            linked_collection.objects.unlink(obj)
+
+    # Use an object that exists in both collections as reference to position the missing objects
+    reference_obj = next((obj for obj in library_objects if obj.data in linked_objects_by_data), None)
+    if reference_obj:
+        offset_library_to_linked = linked_objects_by_data[reference_obj.data].location - reference_obj.location
+    else:
+        offset_library_to_linked = mathutils.Vector((0, 0, 0))
+
+    # Copy objects that were added to the library collection, the copies keep using the object data from the library
+    for obj in library_objects:
+        if obj.data not in linked_objects_by_data:
+            new_obj = obj.copy()
+            new_obj.location += offset_library_to_linked
+            linked_collection.objects.link(new_obj)
+            apply_link_overrides(linked_collection, [new_obj])
+
+
+class CreateLibraryLinkedCollectionOperator(bpy.types.Operator):
+    bl_idname = "object.create_library_linked_collection_operator"
+    bl_label = "Create Library Linked Collection"
+    bl_description = "Link the chosen collection from the library file into a Link Group and create a linked collection of it as a library override"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        abs_path = get_library_abs_path(context.scene.library_filepath)
+        collection_name = context.scene.library_collection
+
+        if collection_name not in get_library_collection_names(abs_path):
+            display_message("Collection not found in the library file", type='ERROR')
+            return {'CANCELLED'}
+
+        # Link the collection from the library, unless that happened before
+        library_collection = None
+        library = next((library for library in bpy.data.libraries if get_library_abs_path(library.filepath) == abs_path), None)
+        if library:
+            library_collection = bpy.data.collections.get((collection_name, library.filepath))
+        if not library_collection:
+            with bpy.data.libraries.load(abs_path, link=True) as (data_from, data_to):
+                data_to.collections = [collection_name]
+            library_collection = data_to.collections[0]
+            library_load_mtimes[abs_path] = os.path.getmtime(abs_path)
+        if not library_collection:
+            display_message("Could not link the collection from the library file", type='ERROR')
+            return {'CANCELLED'}
+
+        # The library collection is the original collection of the Link Group (it can't be renamed or color coded, as it is read-only)
+        link_group = get_link_group(library_collection)
+        if not link_group:
+            link_group = bpy.data.collections.new(f"{collection_name} {link_group_name_suffix}")
+            link_group.color_tag = link_group_collection_color_tag
+            context.scene.collection.children.link(link_group)
+            link_group.children.link(library_collection)
+
+        # Create the linked collection as a library override, its objects keep using the object data from the library
+        # Fully editable, otherwise its objects are system overrides that can't be moved or changed
+        new_collection = library_collection.override_hierarchy_create(context.scene, context.view_layer, do_fully_editable=True)
+
+        # Creating the override may replace the library collection with it or add it to the scene collection, so put both back where they belong
+        for parent_collection in [context.scene.collection, *bpy.data.collections]:
+            if parent_collection == link_group or parent_collection.library or parent_collection.override_library:
+                continue
+            if any(child == new_collection for child in parent_collection.children):
+                parent_collection.children.unlink(new_collection)
+        if not any(child == new_collection for child in link_group.children):
+            link_group.children.link(new_collection)
+        if not any(child == library_collection for child in link_group.children):
+            link_group.children.link(library_collection)
+
+        new_collection.name = f"{collection_name} {linked_collection_name_suffix}"
+        new_collection.color_tag = linked_collection_color_tag
+
+        # Set the newly created collection to be the active scene collection for convenience
+        layer_coll = recur_layer_collection(context.view_layer.layer_collection, new_collection.name)
+        if layer_coll:
+            context.view_layer.active_layer_collection = layer_coll
+
+        # Select objects in the new collection, for convenience
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in new_collection.objects:
+            obj.select_set(True)
+        if new_collection.objects:
+            context.view_layer.objects.active = new_collection.objects[0]
+
+        return {'FINISHED'}
+
+
+class SyncLibraryLinkGroupOperator(bpy.types.Operator):
+    bl_idname = "object.sync_library_link_group_operator"
+    bl_label = "Sync from Library"
+    bl_description = "Sync all linked collections in the active object's Link Group to the library version of the original collection\n- Reloads the library first if its file has changed"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        active_object = context.active_object
+        if not active_object:
+            return {'CANCELLED'}
+
+        link_group = get_link_group(active_object.users_collection[0])
+        library_collection = get_library_collection(link_group) if link_group else None
+        if not library_collection:
+            display_message("The active object is not part of a Link Group with a library collection", type='ERROR')
+            return {'CANCELLED'}
+
+        library_collection = reload_library_if_changed(library_collection)
+        if not library_collection:
+            display_message("The collection was not found in the library anymore", type='ERROR')
+            return {'CANCELLED'}
+
+        for linked_collection in link_group.children:
+            if not linked_collection.library:
+                sync_collection_to_library(library_collection, linked_collection)
+
+        return {'FINISHED'}
+
+####
+
+
+#########################################
+# Tool 6: AUDIT LINK GROUPS
+
+# The report of the last audit, shown in the panel
+link_group_audit_report = None
+link_group_audit_text_name = "Link Group Audit.json"
+
+# Helper function to get the name of an object or collection without the .001 style suffix Blender adds to copies
+def get_base_name(name):
+    return re.sub(r"\.\d{3,}$", "", name)
+
+# Helper function to get the name of a collection without the Link Group suffixes
+def get_link_group_base_name(name):
+    for suffix in (link_group_name_suffix, original_collection_name_suffix, linked_collection_name_suffix):
+        name = name.replace(suffix, "")
+    # strip after removing the .001 suffix, "Foo (Linked).001" would keep a trailing space otherwise
+    return get_base_name(name.strip()).strip()
+
+# Helper function to split the children of a Link Group into its original collections, linked collections and any other collections
+def get_link_group_members(link_group):
+    original_collections = []
+    linked_collections = []
+    other_collections = []
+    for child in link_group.children:
+        if child.library or original_collection_name_suffix in child.name:
+            original_collections.append(child)
+        elif linked_collection_name_suffix in child.name:
+            linked_collections.append(child)
+        else:
+            other_collections.append(child)
+    return (original_collections, linked_collections, other_collections)
+
+# Helper function to compare a linked collection to the original collection, going over each object once
+# Objects without data (e.g. empties) can't be matched by their data, so they are matched by their base name instead
+def audit_linked_collection(original_objects_by_data, original_empties, linked_collection):
+    linked_objects_by_data = {}
+    linked_empties = []
+    for obj in linked_collection.objects:
+        if obj.data is None:
+            linked_empties.append(obj)
+        else:
+            linked_objects_by_data.setdefault(obj.data, []).append(obj)
+
+    # Objects of the original collection that have no counterpart, by their base name
+    missing_by_base_name = {get_base_name(obj.name): obj for data, obj in original_objects_by_data.items() if data not in linked_objects_by_data}
+
+    original_empty_base_names = set(get_base_name(obj.name) for obj in original_empties)
+    linked_empty_base_names = set(get_base_name(obj.name) for obj in linked_empties)
+    missing = [obj.name for obj in original_empties if get_base_name(obj.name) not in linked_empty_base_names]
+    extra = [obj.name for obj in linked_empties if get_base_name(obj.name) not in original_empty_base_names]
+    diverged = []
+    duplicates = []
+    for data, linked_objects in linked_objects_by_data.items():
+        if len(linked_objects) > 1:
+            duplicates.append([obj.name for obj in linked_objects])
+        if data in original_objects_by_data:
+            continue
+        for obj in linked_objects:
+            # An object with its own data but named like a missing original object is a copy that was made single-user
+            original_obj = missing_by_base_name.pop(get_base_name(obj.name), None)
+            if original_obj:
+                diverged.append({"object": obj.name, "original": original_obj.name})
+            else:
+                extra.append(obj.name)
+
+    return {
+        "name": linked_collection.name,
+        "objects": len(linked_collection.objects),
+        "empty": len(linked_collection.objects) == 0,
+        "missing": sorted(missing + [obj.name for obj in missing_by_base_name.values()]),
+        "extra": extra,
+        "diverged": diverged,
+        "duplicates": duplicates,
+    }
+
+# Helper function to audit a single Link Group
+def audit_link_group(link_group, is_top_level):
+    original_collections, linked_collections, other_collections = get_link_group_members(link_group)
+    issues = []
+
+    if not original_collections:
+        issues.append("No original collection")
+    elif len(original_collections) > 1:
+        issues.append("Multiple original collections: " + ", ".join(collection.name for collection in original_collections))
+    for collection in other_collections:
+        issues.append(f"Collection without {original_collection_name_suffix} or {linked_collection_name_suffix} suffix: {collection.name}")
+    if not is_top_level:
+        issues.append("Link Group is nested in another Link Group")
+
+    original_collection = original_collections[0] if original_collections else None
+    original_objects_by_data = {}
+    original_empties = []
+    if original_collection:
+        if len(original_collection.objects) == 0:
+            issues.append("Original collection is empty")
+        for obj in original_collection.objects:
+            if obj.data is None:
+                original_empties.append(obj)
+            elif obj.data in original_objects_by_data:
+                issues.append(f"Duplicate counterparts in original collection: {original_objects_by_data[obj.data].name}, {obj.name}")
+            else:
+                original_objects_by_data[obj.data] = obj
+
+    base_name = get_link_group_base_name(link_group.name)
+    linked_reports = []
+    for linked_collection in linked_collections:
+        if get_link_group_base_name(linked_collection.name) != base_name:
+            issues.append(f"Name doesn't match the Link Group: {linked_collection.name}")
+        linked_report = audit_linked_collection(original_objects_by_data, original_empties, linked_collection)
+        linked_reports.append(linked_report)
+        if linked_report["empty"]:
+            issues.append(f"Linked collection is empty: {linked_collection.name}")
+
+    healthy = not issues and not any(report["missing"] or report["extra"] or report["diverged"] or report["duplicates"] for report in linked_reports)
+
+    return {
+        "name": link_group.name,
+        "original": original_collection.name if original_collection else None,
+        "library": original_collection.library.filepath if original_collection and original_collection.library else None,
+        "status": "OK" if healthy else "ISSUES",
+        "issues": issues,
+        "linked_collections": linked_reports,
+    }
+
+# Audit all Link Groups in one pass over the collections and their objects
+def audit_link_groups():
+    # Map every collection to its parents, so collections outside of a Link Group can be found without searching
+    parents_by_collection = {}
+    for parent_collection in [bpy.context.scene.collection, *bpy.data.collections]:
+        for child in parent_collection.children:
+            parents_by_collection.setdefault(child, []).append(parent_collection)
+
+    link_groups = []
+    orphaned_original_collections = []
+    orphaned_linked_collections = []
+    for collection in bpy.data.collections:
+        parents = parents_by_collection.get(collection, [])
+        in_link_group = any(link_group_name_suffix in parent.name for parent in parents)
+        if link_group_name_suffix in collection.name:
+            link_groups.append(audit_link_group(collection, not in_link_group))
+        elif not in_link_group:
+            if original_collection_name_suffix in collection.name:
+                orphaned_original_collections.append(collection.name)
+            elif linked_collection_name_suffix in collection.name:
+                orphaned_linked_collections.append(collection.name)
+
+    linked_reports = [linked_report for link_group in link_groups for linked_report in link_group["linked_collections"]]
+    return {
+        "link_groups": link_groups,
+        "orphaned_original_collections": orphaned_original_collections,
+        "orphaned_linked_collections": orphaned_linked_collections,
+        "totals": {
+            "link_groups": len(link_groups),
+            "link_groups_with_issues": sum(1 for link_group in link_groups if link_group["status"] != "OK"),
+            "missing": sum(len(report["missing"]) for report in linked_reports),
+            "extra": sum(len(report["extra"]) for report in linked_reports),
+            "diverged": sum(len(report["diverged"]) for report in linked_reports),
+            "duplicates": sum(len(report["duplicates"]) for report in linked_reports),
+            "empty": sum(1 for report in linked_reports if report["empty"]),
+            "orphaned": len(orphaned_original_collections) + len(orphaned_linked_collections),
+        },
+    }
+
+
+class AuditLinkGroupsOperator(bpy.types.Operator):
+    bl_idname = "object.audit_link_groups_operator"
+    bl_label = "Audit Link Groups"
+    bl_description = f"Check all Link Groups for missing, extra, diverged (single-user) and duplicate objects, empty collections and naming issues\n- The full report is written to the \"{link_group_audit_text_name}\" text"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        global link_group_audit_report
+        link_group_audit_report = audit_link_groups()
+
+        # Write the report as JSON into a text datablock, so it can be viewed in the Text Editor or saved
+        text = bpy.data.texts.get(link_group_audit_text_name) or bpy.data.texts.new(link_group_audit_text_name)
+        text.from_string(json.dumps(link_group_audit_report, indent=4))
+
+        totals = link_group_audit_report["totals"]
+        display_message(f"{totals['link_groups_with_issues']} of {totals['link_groups']} Link Groups have issues", type='INFO')
+
+        return {'FINISHED'}
+
+####
+
+
+#########################################
+# Tool 7: LINK GROUP BROWSER
+
+# Names of collections changed since the summary was last updated, collected by the depsgraph handler
+link_group_summary_dirty_collections = set()
+# Set when the whole summary needs to be rebuilt, e.g. after loading a file or undoing
+link_group_summary_needs_rebuild = True
+
+class LinkGroupSummaryItem(bpy.types.PropertyGroup):
+    collection_count: bpy.props.IntProperty(name="Collections")
+    object_count: bpy.props.IntProperty(name="Objects")
+    issue_count: bpy.props.IntProperty(name="Issues")
+    status: bpy.props.EnumProperty(
+        name="Status",
+        items=[('OK', "In Sync", "All linked collections match the original collection"),
+               ('ISSUES', "Issues", "Run the audit for details")])
+
+# Helper function to fill a summary item with the counts and sync status of a Link Group
+def fill_link_group_summary_item(item, link_group):
+    report = audit_link_group(link_group, True)
+    item.name = link_group.name
+    item.collection_count = len(link_group.children)
+    item.object_count = sum(len(child.objects) for child in link_group.children)
+    item.issue_count = len(report["issues"]) + sum(len(linked_report["missing"]) + len(linked_report["extra"]) + len(linked_report["diverged"]) + len(linked_report["duplicates"]) for linked_report in report["linked_collections"])
+    item.status = report["status"]
+
+# Update the cached summary of all Link Groups, only recounting the Link Groups of the given collections (or all of them if None)
+def update_link_group_summary(dirty_collection_names=None):
+    summary = bpy.context.window_manager.link_group_summary
+    link_groups = {collection.name: collection for collection in bpy.data.collections if not collection.library and link_group_name_suffix in collection.name}
+
+    if dirty_collection_names is None:
+        summary.clear()
+        for link_group in link_groups.values():
+            fill_link_group_summary_item(summary.add(), link_group)
+        return
+
+    # Find the Link Groups that contain the changed collections
+    dirty_link_group_names = set(name for name in dirty_collection_names if name in link_groups)
+    for link_group in link_groups.values():
+        if any(child.name in dirty_collection_names for child in link_group.children):
+            dirty_link_group_names.add(link_group.name)
+
+    # Drop Link Groups that were removed or renamed, going backwards so the indices stay valid
+    for index in reversed(range(len(summary))):
+        if summary[index].name not in link_groups:
+            summary.remove(index)
+
+    summarized_names = set(item.name for item in summary)
+    for item in summary:
+        if item.name in dirty_link_group_names:
+            fill_link_group_summary_item(item, link_groups[item.name])
+    for name, link_group in link_groups.items():
+        if name not in summarized_names:
+            fill_link_group_summary_item(summary.add(), link_group)
+
+# Helper function to redraw all 3D Viewports, e.g. after data shown in the panel changed outside of an operator
+def tag_redraw_view3d():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+# Timer to update the summary, so it is updated at most once for a burst of changes and never while drawing
+def flush_link_group_summary():
+    global link_group_summary_needs_rebuild
+    if link_group_summary_needs_rebuild:
+        update_link_group_summary()
+    else:
+        update_link_group_summary(link_group_summary_dirty_collections)
+    link_group_summary_dirty_collections.clear()
+    link_group_summary_needs_rebuild = False
+    tag_redraw_view3d()
+    return None
+
+def schedule_link_group_summary_update():
+    if not bpy.app.timers.is_registered(flush_link_group_summary):
+        bpy.app.timers.register(flush_link_group_summary, first_interval=0.2)
+
+# Remember which collections changed (objects added or removed, renamed, ...) so only their Link Groups are recounted
+# Changes to an object (e.g. its data being made single-user or swapped) mark the collections it is in
+# Moving objects doesn't change the counts or the sync status, so transform-only updates (e.g. while dragging) are skipped
+@bpy.app.handlers.persistent
+def track_link_group_changes(scene, depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Collection):
+            link_group_summary_dirty_collections.add(update.id.original.name)
+        elif isinstance(update.id, bpy.types.Object) and not (update.is_updated_transform and not update.is_updated_geometry):
+            for collection in update.id.original.users_collection:
+                link_group_summary_dirty_collections.add(collection.name)
+    if link_group_summary_dirty_collections:
+        schedule_link_group_summary_update()
+
+@bpy.app.handlers.persistent
+def rebuild_link_group_summary(dummy):
+    global link_group_summary_needs_rebuild
+    link_group_summary_needs_rebuild = True
+    schedule_link_group_summary_update()
+
+
+class LinkGroupList(bpy.types.UIList):
+    bl_idname = "OBJECT_UL_link_groups"
+
+    sort_by: bpy.props.EnumProperty(
+        name="Sort by",
+        items=[('NAME', "Name", "Sort by name"),
+               ('OBJECTS', "Objects", "Sort by number of objects"),
+               ('ISSUES', "Issues", "Sort by number of issues")],
+        default='NAME')
+    only_issues: bpy.props.BoolProperty(name="Only Issues", description="Only show Link Groups with issues", default=False)
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon="CHECKMARK" if item.status == 'OK' else "ERROR")
+        row.label(text=f"{item.collection_count} col.  {item.object_count} obj.")
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "only_issues", text="", icon="ERROR")
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", expand=True)
+        row.prop(self, "use_filter_sort_reverse", text="", icon="SORT_DESC" if self.use_filter_sort_reverse else "SORT_ASC")
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        helper_funcs = bpy.types.UI_UL_list
+
+        if self.filter_name:
+            flt_flags = helper_funcs.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+        else:
+            flt_flags = [self.bitflag_filter_item] * len(items)
+        if self.only_issues:
+            for index, item in enumerate(items):
+                if item.status == 'OK':
+                    flt_flags[index] = 0
+
+        if self.sort_by == 'NAME':
+            flt_neworder = helper_funcs.sort_items_by_name(items, "name")
+        elif self.sort_by == 'OBJECTS':
+            flt_neworder = helper_funcs.sort_items_helper([(index, item.object_count) for index, item in enumerate(items)], lambda entry: entry[1])
+        else:
+            flt_neworder = helper_funcs.sort_items_helper([(index, item.issue_count) for index, item in enumerate(items)], lambda entry: entry[1])
+
+        return flt_flags, flt_neworder
+
+
+class RefreshLinkGroupSummaryOperator(bpy.types.Operator):
+    bl_idname = "object.refresh_link_group_summary_operator"
+    bl_label = "Refresh Link Groups"
+    bl_description = "Recount all Link Groups in the list"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        update_link_group_summary()
+        return {'FINISHED'}
+
+
+# Tool for selecting all objects sharing data with the selected objects (their counterparts in the other linked collections)
+class SelectCounterpartsOperator(bpy.types.Operator):
+    bl_idname = "object.select_counterparts_operator"
+    bl_label = "Select Counterparts"
+    bl_description = "Select the counterparts of all selected objects in all linked collections"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        selected_data = set(obj.data for obj in context.selected_objects if obj.data)
+        for obj in context.view_layer.objects:
+            if obj.data in selected_data and obj.visible_get():
+                obj.select_set(True)
+
+        return {'FINISHED'}
+
+
+# Tool for setting the active collection to the Link Group selected in the list
+class JumpToLinkGroupOperator(bpy.types.Operator):
+    bl_idname = "object.jump_to_link_group_operator"
+    bl_label = "Jump to Collection"
+    bl_description = "Set the Link Group selected in the list to be the active collection"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        window_manager = context.window_manager
+        if not 0 <= window_manager.link_group_summary_index < len(window_manager.link_group_summary):
+            return {'CANCELLED'}
+
+        link_group_name = window_manager.link_group_summary[window_manager.link_group_summary_index].name
+        layer_coll = recur_layer_collection(context.view_layer.layer_collection, link_group_name)
+        if not layer_coll:
+            display_message("Link Group is not in the current view layer", type='ERROR')
+            return {'CANCELLED'}
+        context.view_layer.active_layer_collection = layer_coll
+
+        return {'FINISHED'}
+
+
+class LinkGroupBrowserPanel(bpy.types.Panel):
+    bl_label = "Link Groups"
+    bl_idname = "OBJECT_PT_link_group_browser"
+    bl_parent_id = "OBJECT_PT_create_linked_collection"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'LC Toolbox'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    # Only draws the cached summary, so the panel stays fast no matter how many Link Groups there are
+    def draw(self, context):
+        layout = self.layout
+        window_manager = context.window_manager
+
+        row = layout.row()
+        row.template_list("OBJECT_UL_link_groups", "", window_manager, "link_group_summary", window_manager, "link_group_summary_index", rows=6)
+        col = row.column(align=True)
+        col.operator("object.refresh_link_group_summary_operator", text="", icon="FILE_REFRESH")
+
+        row = layout.row(align=True)
+        row.operator("object.select_counterparts_operator", text="Select Counterparts", icon="RESTRICT_SELECT_OFF")
+        row.operator("object.jump_to_link_group_operator", text="Jump to Collection", icon="OUTLINER_COLLECTION")
+
+####
+
+
+#########################################
+# Tool 8: OVERRIDE LAYERS
+
+# A single change of an object in a linked collection compared to its counterpart in the original collection
+# Stored on the linked collection, so the object data can stay shared between all linked collections
+class LinkedCollectionOverride(bpy.types.PropertyGroup):
+    # The objects are identified by the data of their original counterpart, like everywhere else in the toolbox
+    # A pointer rather than the name, so renaming the object or its data doesn't lose the override
+    original_object: bpy.props.PointerProperty(name="Original Object", type=bpy.types.Object)
+    type: bpy.props.EnumProperty(
+        name="Type",
+        items=[('MATERIAL', "Material", "Use a different material in a material slot"),
+               ('MODIFIER', "Modifier", "Enable or disable a modifier"),
+               ('VISIBILITY', "Visibility", "Show or hide the object")])
+    slot_index: bpy.props.IntProperty(name="Material Slot")
+    material: bpy.props.PointerProperty(name="Material", type=bpy.types.Material)
+    modifier_name: bpy.props.StringProperty(name="Modifier")
+    show_viewport: bpy.props.BoolProperty(name="Show in Viewport")
+    show_render: bpy.props.BoolProperty(name="Show in Render")
+    hide_viewport: bpy.props.BoolProperty(name="Disable in Viewport")
+    hide_render: bpy.props.BoolProperty(name="Disable in Render")
+
+# Helper function to get the counterparts of a linked collection's objects in the original collection of its Link Group
+def get_original_counterparts_by_data(linked_collection):
+    link_group = get_link_group(linked_collection)
+    if not link_group:
+        return {}
+    original_collections, linked_collections, other_collections = get_link_group_members(link_group)
+    if not original_collections or linked_collection in original_collections:
+        return {}
+    return get_counterparts_by_data(original_collections[0])
+
+# Helper function to store the differences between an object in a linked collection and its original counterpart as overrides of the linked collection
+def store_link_overrides(linked_collection, obj, original_obj):
+    overrides = linked_collection.link_overrides
+
+    # Replace any overrides stored for this object before
+    remove_link_overrides(linked_collection, obj)
+
+    for slot_index, slot in enumerate(obj.material_slots):
+        if slot.link == 'OBJECT' and slot_index < len(original_obj.material_slots) and slot.material != original_obj.material_slots[slot_index].material:
+            override = overrides.add()
+            override.original_object = original_obj
+            override.type = 'MATERIAL'
+            override.slot_index = slot_index
+            override.material = slot.material
+
+    for modifier in obj.modifiers:
+        original_modifier = original_obj.modifiers.get(modifier.name)
+        if original_modifier and (modifier.show_viewport != original_modifier.show_viewport or modifier.show_render != original_modifier.show_render):
+            override = overrides.add()
+            override.original_object = original_obj
+            override.type = 'MODIFIER'
+            override.modifier_name = modifier.name
+            override.show_viewport = modifier.show_viewport
+            override.show_render = modifier.show_render
+
+    if obj.hide_viewport != original_obj.hide_viewport or obj.hide_render != original_obj.hide_render:
+        override = overrides.add()
+        override.original_object = original_obj
+        override.type = 'VISIBILITY'
+        override.hide_viewport = obj.hide_viewport
+        override.hide_render = obj.hide_render
+
+# Helper function to remove the overrides stored for an object of a linked collection
+def remove_link_overrides(linked_collection, obj):
+    overrides = linked_collection.link_overrides
+    for index in reversed(range(len(overrides))):
+        original_object = overrides[index].original_object
+        if original_object and original_object.data == obj.data:
+            overrides.remove(index)
+
+# Apply the overrides of a linked collection to its objects (or only to the given objects of it, e.g. newly synced ones)
+# Returns the number of overrides that didn't match any object, e.g. because the original object was deleted or its data replaced
+def apply_link_overrides(linked_collection, objects=None):
+    overrides = linked_collection.link_overrides
+    if not overrides:
+        return 0
+
+    objects_by_data = {}
+    for obj in (objects if objects is not None else linked_collection.objects):
+        if obj.data:
+            objects_by_data.setdefault(obj.data, []).append(obj)
+
+    unmatched_overrides = 0
+    for override in overrides:
+        matching_objects = objects_by_data.get(override.original_object.data) if override.original_object else None
+        if not matching_objects:
+            if override.original_object is None or objects is None:
+                unmatched_overrides += 1
+            continue
+        for obj in matching_objects:
+            if override.type == 'MATERIAL':
+                if override.slot_index < len(obj.material_slots):
+                    # Linking the material to the object instead of its data leaves the data shared
+                    slot = obj.material_slots[override.slot_index]
+                    slot.link = 'OBJECT'
+                    slot.material = override.material
+            elif override.type == 'MODIFIER':
+                modifier = obj.modifiers.get(override.modifier_name)
+                if modifier:
+                    modifier.show_viewport = override.show_viewport
+                    modifier.show_render = override.show_render
+            elif override.type == 'VISIBILITY':
+                obj.hide_viewport = override.hide_viewport
+                obj.hide_render = override.hide_render
+
+    return unmatched_overrides
+
+# Helper function to reset an object to the state of its original counterpart, undoing its overrides
+def reset_to_original(obj, original_obj):
+    for slot_index, slot in enumerate(obj.material_slots):
+        if slot_index < len(original_obj.material_slots):
+            original_slot = original_obj.material_slots[slot_index]
+            slot.link = original_slot.link
+            if original_slot.link == 'OBJECT':
+                slot.material = original_slot.material
+    for modifier in obj.modifiers:
+        original_modifier = original_obj.modifiers.get(modifier.name)
+        if original_modifier:
+            modifier.show_viewport = original_modifier.show_viewport
+            modifier.show_render = original_modifier.show_render
+    obj.hide_viewport = original_obj.hide_viewport
+    obj.hide_render = original_obj.hide_render
+
+
+class StoreLinkOverridesOperator(bpy.types.Operator):
+    bl_idname = "object.store_link_overrides_operator"
+    bl_label = "Store Overrides"
+    bl_description = "Store the differences of the selected objects to their originals (object materials, modifier toggles, visibility) as overrides of their linked collection\n- Overrides are kept when syncing, without making the object data single-user"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        stored_objects = 0
+        for obj in context.selected_objects:
+            if not obj.data:
+                continue
+            linked_collection = obj.users_collection[0]
+            original_obj = get_original_counterparts_by_data(linked_collection).get(obj.data)
+            if original_obj:
+                store_link_overrides(linked_collection, obj, original_obj)
+                stored_objects += 1
+
+        if not stored_objects:
+            display_message("None of the selected objects are in a linked collection", type='ERROR')
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+
+class ClearLinkOverridesOperator(bpy.types.Operator):
+    bl_idname = "object.clear_link_overrides_operator"
+    bl_label = "Clear Overrides"
+    bl_description = "Remove the overrides of the selected objects and reset them to their originals"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        for obj in context.selected_objects:
+            if not obj.data:
+                continue
+            linked_collection = obj.users_collection[0]
+            remove_link_overrides(linked_collection, obj)
+            original_obj = get_original_counterparts_by_data(linked_collection).get(obj.data)
+            if original_obj:
+                reset_to_original(obj, original_obj)
+
+        return {'FINISHED'}
+
+
+class ApplyLinkOverridesOperator(bpy.types.Operator):
+    bl_idname = "object.apply_link_overrides_operator"
+    bl_label = "Apply Overrides"
+    bl_description = "Apply the stored overrides of all linked collections in the active object's Link Group again, e.g. after changing the originals"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        active_object = context.active_object
+        link_group = get_link_group(active_object.users_collection[0]) if active_object else None
+        if not link_group:
+            display_message("The active object is not part of a Link Group", type='ERROR')
+            return {'CANCELLED'}
+
+        original_collections, linked_collections, other_collections = get_link_group_members(link_group)
+        unmatched_overrides = 0
+        for linked_collection in linked_collections:
+            unmatched_overrides += apply_link_overrides(linked_collection)
+
+        if unmatched_overrides:
+            display_message(f"{unmatched_overrides} overrides don't match any object anymore, store them again", type='ERROR')
+
+        return {'FINISHED'}
+
+####
+
+
+#########################################
+# Tool 9: VIEWPORT CULLING
+
+# How often (in seconds) the culling is updated while it is enabled
+culling_update_interval = 0.5
+# World-space bounding box (min corner, max corner) of each linked collection, or None for empty collections, keyed by collection name
+culling_bounds_cache = {}
+# The state of culled collections and objects before they were culled is stored on them as custom properties, rather than in Python
+# That way the culled state and the state to restore always match, even after undo, redo or renaming
+culling_hide_viewport_property = "culling_previous_hide_viewport"
+culling_display_type_property = "culling_previous_display_type"
+
+# Helper function to get the cached bounding box of a collection's objects in world space, recalculating it if it was invalidated
+def get_collection_bounds(collection):
+    if collection.name not in culling_bounds_cache:
+        bounds = None
+        for obj in collection.objects:
+            for corner in obj.bound_box:
+                world_corner = obj.matrix_world @ mathutils.Vector(corner)
+                if bounds is None:
+                    bounds = (world_corner.copy(), world_corner.copy())
+                else:
+                    for axis in range(3):
+                        bounds[0][axis] = min(bounds[0][axis], world_corner[axis])
+                        bounds[1][axis] = max(bounds[1][axis], world_corner[axis])
+        culling_bounds_cache[collection.name] = bounds
+    return culling_bounds_cache[collection.name]
+
+# Helper function to check if a bounding box is further away from the view than the culling distance or outside of the view frustum
+def is_outside_view(bounds, view_location, perspective_matrix, culling_distance, use_frustum):
+    min_corner, max_corner = bounds
+
+    # distance from the view to the closest point of the bounding box
+    closest_point = mathutils.Vector([min(max(view_location[axis], min_corner[axis]), max_corner[axis]) for axis in range(3)])
+    if (closest_point - view_location).length > culling_distance:
+        return True
+
+    if use_frustum:
+        # the box is outside of the frustum if all its corners are on the outer side of the same clipping plane
+        clip_corners = [perspective_matrix @ mathutils.Vector((x, y, z, 1.0)) for x in (min_corner.x, max_corner.x) for y in (min_corner.y, max_corner.y) for z in (min_corner.z, max_corner.z)]
+        for axis in range(3):
+            if all(corner[axis] < -corner.w for corner in clip_corners) or all(corner[axis] > corner.w for corner in clip_corners):
+                return True
+
+    return False
+
+def is_collection_culled(collection):
+    return culling_hide_viewport_property in collection or culling_display_type_property in collection
+
+def cull_collection(collection, culling_mode):
+    if culling_mode == 'DISABLE':
+        collection[culling_hide_viewport_property] = collection.hide_viewport
+        collection.hide_viewport = True
+    else:
+        # the collection only marks that its objects are displayed as bounds, the display types to restore are stored on the objects
+        collection[culling_display_type_property] = True
+        for obj in collection.objects:
+            if culling_display_type_property not in obj:
+                obj[culling_display_type_property] = obj.display_type
+                obj.display_type = 'BOUNDS'
+
+def uncull_object(obj):
+    obj.display_type = obj[culling_display_type_property]
+    del obj[culling_display_type_property]
+
+# Restore a culled collection to exactly the state it had before it was culled
+def uncull_collection(collection):
+    if culling_hide_viewport_property in collection:
+        collection.hide_viewport = collection[culling_hide_viewport_property]
+        del collection[culling_hide_viewport_property]
+    if culling_display_type_property in collection:
+        del collection[culling_display_type_property]
+        for obj in collection.objects:
+            if culling_display_type_property in obj:
+                uncull_object(obj)
+
+def restore_culled_collections():
+    for collection in bpy.data.collections:
+        if not collection.library and is_collection_culled(collection):
+            uncull_collection(collection)
+    # objects that were moved to another collection while they were culled
+    for obj in bpy.data.objects:
+        if not obj.library and culling_display_type_property in obj:
+            uncull_object(obj)
+
+# Helper function to get the view of the first 3D Viewport
+def get_view_region_3d():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                return area.spaces.active.region_3d
+    return None
+
+# Timer updating which linked collections are culled, so the culling isn't recalculated on every redraw
+def update_culling():
+    scene = bpy.context.scene
+    if not scene.culling_enabled:
+        restore_culled_collections()
+        return None
+
+    region_3d = get_view_region_3d()
+    if not region_3d:
+        return culling_update_interval
+    view_location = region_3d.view_matrix.inverted().translation
+    perspective_matrix = region_3d.perspective_matrix
+
+    # Original collections are never culled, so they can always be edited
+    for link_group in bpy.data.collections:
+        if link_group_name_suffix not in link_group.name:
+            continue
+        original_collections, linked_collections, other_collections = get_link_group_members(link_group)
+        for linked_collection in linked_collections:
+            bounds = get_collection_bounds(linked_collection)
+            outside_view = bounds is not None and is_outside_view(bounds, view_location, perspective_matrix, scene.culling_distance, scene.culling_use_frustum)
+            culled = is_collection_culled(linked_collection)
+            if outside_view and not culled:
+                cull_collection(linked_collection, scene.culling_mode)
+            elif not outside_view and culled:
+                uncull_collection(linked_collection)
+
+    return culling_update_interval
+
+def update_culling_enabled(self, context):
+    if self.culling_enabled:
+        if not bpy.app.timers.is_registered(update_culling):
+            bpy.app.timers.register(update_culling)
+    else:
+        restore_culled_collections()
+
+# Culled collections are restored when the mode changes, the next update culls them again with the new mode
+def update_culling_mode(self, context):
+    restore_culled_collections()
+
+bpy.types.Scene.culling_enabled = BoolProperty(
+    name="Viewport Culling",
+        description="Hide linked collections that are far away from the view or outside of it.\nThe previous state is restored when disabling the culling",
+        default = False,
+        update=update_culling_enabled)
+
+bpy.types.Scene.culling_mode = EnumProperty(
+    name="Culling Mode",
+        description="How culled linked collections are hidden",
+        items=[('DISABLE', "Disable", "Disable the collections in the viewport, so they aren't evaluated either"),
+               ('BOUNDS', "Bounds", "Display the objects of the collections as bounding boxes")],
+        default='DISABLE',
+        update=update_culling_mode)
+
+bpy.types.Scene.culling_distance = bpy.props.FloatProperty(
+    name="Culling Distance",
+        description="Linked collections further away from the view than this are culled",
+        default=100.0,
+        min=0.0,
+        subtype='DISTANCE')
+
+bpy.types.Scene.culling_use_frustum = BoolProperty(
+    name="Cull Outside of View",
+        description="Also cull linked collections that are outside of the view",
+        default = False)
+
+# Invalidate the cached bounds of collections whose objects were moved or changed
+@bpy.app.handlers.persistent
+def invalidate_culling_bounds(scene, depsgraph):
+    if not culling_bounds_cache:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry):
+            for collection in update.id.original.users_collection:
+                culling_bounds_cache.pop(collection.name, None)
+        elif isinstance(update.id, bpy.types.Collection):
+            culling_bounds_cache.pop(update.id.original.name, None)
+
+# Never save culled states into the file, the next culling update culls the collections again
+@bpy.app.handlers.persistent
+def restore_culling_before_save(dummy):
+    restore_culled_collections()
+
+# Files saved without the save handlers (e.g. autosaves) may contain culled collections, restore them if the culling is disabled
+@bpy.app.handlers.persistent
+def reset_culling_on_load(dummy):
+    culling_bounds_cache.clear()
+    if not bpy.context.scene.culling_enabled:
+        restore_culled_collections()
+    elif not bpy.app.timers.is_registered(update_culling):
+        bpy.app.timers.register(update_culling)
+
+# Undo and redo can move objects without a depsgraph update reaching the bounds invalidation
+@bpy.app.handlers.persistent
+def reset_culling_bounds(dummy):
+    culling_bounds_cache.clear()
+
+####
+
+
+#########################################
+# Tool 10: MEMORY ACCOUNTING
+
+# The report of the last memory accounting, shown in the panel
+link_group_memory_report = None
+link_group_memory_text_name = "Link Group Memory.csv"
+link_group_memory_csv_columns = ["name", "objects", "data_blocks", "vertex_bytes", "polygon_bytes", "attribute_bytes", "modifier_bytes", "shared_bytes", "duplicated_bytes", "total_bytes"]
+
+# Size in bytes of a single value of each attribute data type, as read with foreach_get
+attribute_type_sizes = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'STRING': 1,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+# Helper function to estimate the bytes of a mesh from the sizes of its arrays, without reading them
+# Returns the bytes of the vertices, polygons (including edges and corners) and the other attributes
+def get_mesh_bytes(mesh):
+    vertex_bytes = len(mesh.vertices) * 3 * 4
+    # loop_start and loop_total per polygon, vertex and edge index per corner, two vertex indices per edge
+    polygon_bytes = (len(mesh.polygons) * 2 + len(mesh.loops) * 2 + len(mesh.edges) * 2) * 4
+
+    domain_sizes = {'POINT': len(mesh.vertices), 'EDGE': len(mesh.edges), 'FACE': len(mesh.polygons), 'CORNER': len(mesh.loops)}
+    attribute_bytes = 0
+    for attribute in mesh.attributes:
+        # positions are counted as vertices, internal attributes (starting with a dot) as polygons already
+        if attribute.name == "position" or attribute.name.startswith("."):
+            continue
+        attribute_bytes += domain_sizes.get(attribute.domain, 0) * attribute_type_sizes.get(attribute.data_type, 4)
+
+    return (vertex_bytes, polygon_bytes, attribute_bytes)
+
+# Helper function to estimate the bytes of the mesh an object's modifiers evaluate to
+# Modifiers are evaluated for every object on its own, so this memory is never shared between linked objects
+def get_modifier_bytes(obj, depsgraph):
+    if obj.type != 'MESH' or not any(modifier.show_viewport for modifier in obj.modifiers):
+        return 0
+    # objects that aren't evaluated (other scenes, excluded, disabled or culled collections) are returned as they are and hold no modifier result
+    evaluated_obj = obj.evaluated_get(depsgraph)
+    if evaluated_obj == obj:
+        return 0
+    return sum(get_mesh_bytes(evaluated_obj.data))
+
+# Helper function to get the bytes of an object's data, only estimating each data-block once per accounting
+def get_data_bytes(data, data_bytes_cache):
+    if data not in data_bytes_cache:
+        data_bytes_cache[data] = get_mesh_bytes(data) if isinstance(data, bpy.types.Mesh) else (0, 0, 0)
+    return data_bytes_cache[data]
+
+# Helper function to account the memory of a single Link Group
+def account_link_group_memory(link_group, depsgraph, data_bytes_cache):
+    original_collections, linked_collections, other_collections = get_link_group_members(link_group)
+
+    object_count = 0
+    modifier_bytes = 0
+    users_by_data = {}
+    linked_data = set()
+    for collection in original_collections + linked_collections:
+        for obj in collection.objects:
+            object_count += 1
+            modifier_bytes += get_modifier_bytes(obj, depsgraph)
+            if obj.data:
+                users_by_data[obj.data] = users_by_data.get(obj.data, 0) + 1
+                if collection in linked_collections:
+                    linked_data.add(obj.data)
+
+    # Data used by only a single object of a linked collection is duplicated, as the object is a copy that was made single-user
+    # (objects that were only ever added to that one linked collection are counted as well, as they can't be told apart by their data)
+    duplicated_data = set(data for data in linked_data if users_by_data[data] == 1)
+
+    row = {column: 0 for column in link_group_memory_csv_columns}
+    row["name"] = link_group.name
+    row["objects"] = object_count
+    # only meshes, like the byte estimates
+    row["data_blocks"] = sum(1 for data in users_by_data if isinstance(data, bpy.types.Mesh))
+    row["modifier_bytes"] = modifier_bytes
+    for data, users in users_by_data.items():
+        vertex_bytes, polygon_bytes, attribute_bytes = get_data_bytes(data, data_bytes_cache)
+        row["vertex_bytes"] += vertex_bytes
+        row["polygon_bytes"] += polygon_bytes
+        row["attribute_bytes"] += attribute_bytes
+        if users > 1:
+            row["shared_bytes"] += vertex_bytes + polygon_bytes + attribute_bytes
+        if data in duplicated_data:
+            row["duplicated_bytes"] += vertex_bytes + polygon_bytes + attribute_bytes
+    row["total_bytes"] = row["vertex_bytes"] + row["polygon_bytes"] + row["attribute_bytes"] + row["modifier_bytes"]
+
+    return row
+
+# Account the memory of all Link Groups and of the whole file
+def account_link_group_memory_usage(depsgraph):
+    data_bytes_cache = {}
+    link_groups = [account_link_group_memory(collection, depsgraph, data_bytes_cache) for collection in bpy.data.collections if link_group_name_suffix in collection.name]
+
+    file_row = {column: 0 for column in link_group_memory_csv_columns}
+    file_row["name"] = "(File)"
+    file_row["objects"] = len(bpy.data.objects)
+    file_row["data_blocks"] = len(bpy.data.meshes)
+    file_row["modifier_bytes"] = sum(get_modifier_bytes(obj, depsgraph) for obj in bpy.data.objects)
+    for mesh in bpy.data.meshes:
+        vertex_bytes, polygon_bytes, attribute_bytes = get_data_bytes(mesh, data_bytes_cache)
+        file_row["vertex_bytes"] += vertex_bytes
+        file_row["polygon_bytes"] += polygon_bytes
+        file_row["attribute_bytes"] += attribute_bytes
+        if mesh.users > 1:
+            file_row["shared_bytes"] += vertex_bytes + polygon_bytes + attribute_bytes
+    file_row["duplicated_bytes"] = sum(row["duplicated_bytes"] for row in link_groups)
+    file_row["total_bytes"] = file_row["vertex_bytes"] + file_row["polygon_bytes"] + file_row["attribute_bytes"] + file_row["modifier_bytes"]
+
+    return {"link_groups": link_groups, "file": file_row}
+
+# Helper function to write the memory report as CSV, one row per Link Group and one for the whole file
+def get_link_group_memory_csv(memory_report):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=link_group_memory_csv_columns, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(memory_report["link_groups"])
+    writer.writerow(memory_report["file"])
+    return output.getvalue()
+
+# Helper function to format bytes for the panel
+def format_bytes(byte_count):
+    for unit in ("B", "KB", "MB"):
+        if byte_count < 1024:
+            return f"{byte_count:.0f} {unit}" if unit == "B" else f"{byte_count:.1f} {unit}"
+        byte_count /= 1024
+    return f"{byte_count:.1f} GB"
+
+
+class AccountLinkGroupMemoryOperator(bpy.types.Operator):
+    bl_idname = "object.account_link_group_memory_operator"
+    bl_label = "Memory Usage"
+    bl_description = f"Estimate the memory used by each Link Group and the whole file, separating shared data from data duplicated by single-user copies\n- The full report is written to the \"{link_group_memory_text_name}\" text"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        global link_group_memory_report
+        link_group_memory_report = account_link_group_memory_usage(context.evaluated_depsgraph_get())
+
+        text = bpy.data.texts.get(link_group_memory_text_name) or bpy.data.texts.new(link_group_memory_text_name)
+        text.from_string(get_link_group_memory_csv(link_group_memory_report))
+
+        return {'FINISHED'}
+
+
+class ExportLinkGroupMemoryOperator(bpy.types.Operator, ExportHelper):
+    bl_idname = "object.export_link_group_memory_operator"
+    bl_label = "Export Memory Usage"
+    bl_description = "Export the memory used by each Link Group and the whole file as CSV"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".csv"
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+
+    def execute(self, context):
+        memory_report = account_link_group_memory_usage(context.evaluated_depsgraph_get())
+        with open(self.filepath, "w", newline="") as csv_file:
+            csv_file.write(get_link_group_memory_csv(memory_report))
+
+        return {'FINISHED'}
+
+####
+
+
 #########################################
 # TOOLBOX PANEL + REGISTRATION
 
@@ -770,6 +2053,70 @@ class LinkedCollectionToolBoxPanel(bpy.types.Panel):
 
         # Tool for disabling all selected objects in the viewport
         layout.operator("object.disable_selected_in_viewport_operator",text="Disable selected in Viewport",icon="HIDE_ON")
+        layout.separator()
+
+        # Tool 5: Library Link Groups
+        layout.label(text="LIBRARY")
+        layout.prop(context.scene, "library_filepath", text="")
+        layout.prop(context.scene, "library_collection", text="")
+        layout.operator("object.create_library_linked_collection_operator",text="Create from Library",icon="LINK_BLEND")
+        layout.operator("object.sync_library_link_group_operator",text="Sync from Library",icon="FILE_REFRESH")
+        layout.separator()
+
+        # Tool 6: Audit Link Groups
+        layout.label(text="AUDIT")
+        layout.operator("object.audit_link_groups_operator",text="Audit Link Groups",icon="VIEWZOOM")
+        if link_group_audit_report:
+            totals = link_group_audit_report["totals"]
+            box = layout.box()
+            box.label(text=f"{totals['link_groups_with_issues']} of {totals['link_groups']} Link Groups with issues")
+            box.label(text=f"Missing: {totals['missing']}  Extra: {totals['extra']}  Diverged: {totals['diverged']}")
+            box.label(text=f"Duplicates: {totals['duplicates']}  Empty: {totals['empty']}  Orphaned: {totals['orphaned']}")
+            # only list the first few Link Groups with issues, the full report is in the text datablock
+            link_groups_with_issues = [link_group for link_group in link_group_audit_report["link_groups"] if link_group["status"] != "OK"]
+            for link_group in link_groups_with_issues[:10]:
+                box.label(text=link_group["name"], icon="ERROR")
+            if len(link_groups_with_issues) > 10:
+                box.label(text=f"... and {len(link_groups_with_issues) - 10} more, see \"{link_group_audit_text_name}\"")
+        layout.separator()
+
+        # Tool 8: Override Layers
+        layout.label(text="OVERRIDES")
+        if context.active_object:
+            override_count = len(context.active_object.users_collection[0].link_overrides)
+            if override_count:
+                layout.label(text=f"{override_count} overrides in active collection")
+        row = layout.row(align=True)
+        row.operator("object.store_link_overrides_operator",text="Store",icon="ADD")
+        row.operator("object.clear_link_overrides_operator",text="Clear",icon="X")
+        row.operator("object.apply_link_overrides_operator",text="Apply",icon="CHECKMARK")
+        layout.separator()
+
+        # Tool 9: Viewport Culling
+        layout.label(text="CULLING")
+        layout.prop(context.scene, "culling_enabled", text="Viewport Culling")
+        col = layout.column(align=True)
+        col.active = context.scene.culling_enabled
+        col.prop(context.scene, "culling_mode", text="")
+        col.prop(context.scene, "culling_distance", text="Distance")
+        col.prop(context.scene, "culling_use_frustum", text="Cull outside of View")
+        layout.separator()
+
+        # Tool 10: Memory Accounting
+        layout.label(text="MEMORY")
+        row = layout.row(align=True)
+        row.operator("object.account_link_group_memory_operator",text="Memory Usage",icon="MEMORY")
+        row.operator("object.export_link_group_memory_operator",text="",icon="EXPORT")
+        if link_group_memory_report:
+            file_row = link_group_memory_report["file"]
+            box = layout.box()
+            box.label(text=f"File: {format_bytes(file_row['total_bytes'])} ({file_row['data_blocks']} meshes, {file_row['objects']} objects)")
+            box.label(text=f"Shared: {format_bytes(file_row['shared_bytes'])}  Duplicated: {format_bytes(file_row['duplicated_bytes'])}")
+            box.label(text=f"Modifiers: {format_bytes(file_row['modifier_bytes'])}")
+            # the Link Groups where relinking single-user copies would save the most
+            for link_group_row in sorted(link_group_memory_report["link_groups"], key=lambda link_group_row: link_group_row["duplicated_bytes"], reverse=True)[:5]:
+                if link_group_row["duplicated_bytes"]:
+                    box.label(text=f"{link_group_row['name']}: {format_bytes(link_group_row['duplicated_bytes'])} duplicated", icon="ERROR")
 
 def register():
     bpy.utils.register_class(CreateLinkedCollectionOperator)
@@ -780,8 +2127,66 @@ def register():
     bpy.utils.register_class(LinkedCollectionToolBoxPanel)
     bpy.utils.register_class(SetOrigin)
     bpy.utils.register_class(DisableSelectedInViewport)
+    bpy.utils.register_class(CreateLibraryLinkedCollectionOperator)
+    bpy.utils.register_class(SyncLibraryLinkGroupOperator)
+    bpy.utils.register_class(AuditLinkGroupsOperator)
+    bpy.utils.register_class(LinkedCollectionOverride)
+    # overridable, so the overrides can also be stored on linked collections created from a library
+    bpy.types.Collection.link_overrides = bpy.props.CollectionProperty(type=LinkedCollectionOverride, override={'LIBRARY_OVERRIDABLE', 'USE_INSERTION'})
+    bpy.utils.register_class(StoreLinkOverridesOperator)
+    bpy.utils.register_class(ClearLinkOverridesOperator)
+    bpy.utils.register_class(ApplyLinkOverridesOperator)
+    bpy.utils.register_class(LinkGroupSummaryItem)
+    bpy.types.WindowManager.link_group_summary = bpy.props.CollectionProperty(type=LinkGroupSummaryItem)
+    bpy.types.WindowManager.link_group_summary_index = bpy.props.IntProperty(name="Active Link Group")
+    bpy.utils.register_class(LinkGroupList)
+    bpy.utils.register_class(RefreshLinkGroupSummaryOperator)
+    bpy.utils.register_class(SelectCounterpartsOperator)
+    bpy.utils.register_class(JumpToLinkGroupOperator)
+    bpy.utils.register_class(LinkGroupBrowserPanel)
+    bpy.app.handlers.depsgraph_update_post.append(track_link_group_changes)
+    bpy.app.handlers.load_post.append(rebuild_link_group_summary)
+    bpy.app.handlers.undo_post.append(rebuild_link_group_summary)
+    bpy.app.handlers.redo_post.append(rebuild_link_group_summary)
+    rebuild_link_group_summary(None)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_culling_bounds)
+    bpy.app.handlers.save_pre.append(restore_culling_before_save)
+    bpy.app.handlers.load_post.append(reset_culling_on_load)
+    bpy.app.handlers.undo_post.append(reset_culling_bounds)
+    bpy.app.handlers.redo_post.append(reset_culling_bounds)
+    bpy.utils.register_class(AccountLinkGroupMemoryOperator)
+    bpy.utils.register_class(ExportLinkGroupMemoryOperator)
+    bpy.app.handlers.load_post.append(record_library_mtimes)
+    bpy.app.handlers.depsgraph_update_post.append(record_new_library_mtimes)
+    # bpy.data can't be accessed while registering, so check the libraries of the current file right after
+    bpy.app.timers.register(mark_library_mtimes_unknown)
 
 def unregister():
+    bpy.app.handlers.depsgraph_update_post.remove(invalidate_culling_bounds)
+    bpy.app.handlers.save_pre.remove(restore_culling_before_save)
+    bpy.app.handlers.load_post.remove(reset_culling_on_load)
+    bpy.app.handlers.undo_post.remove(reset_culling_bounds)
+    bpy.app.handlers.redo_post.remove(reset_culling_bounds)
+    if bpy.app.timers.is_registered(update_culling):
+        bpy.app.timers.unregister(update_culling)
+    restore_culled_collections()
+    bpy.utils.unregister_class(AccountLinkGroupMemoryOperator)
+    bpy.utils.unregister_class(ExportLinkGroupMemoryOperator)
+    # sub-panels have to be unregistered before their parent panel
+    bpy.app.handlers.depsgraph_update_post.remove(track_link_group_changes)
+    bpy.app.handlers.load_post.remove(rebuild_link_group_summary)
+    bpy.app.handlers.undo_post.remove(rebuild_link_group_summary)
+    bpy.app.handlers.redo_post.remove(rebuild_link_group_summary)
+    if bpy.app.timers.is_registered(flush_link_group_summary):
+        bpy.app.timers.unregister(flush_link_group_summary)
+    bpy.utils.unregister_class(LinkGroupBrowserPanel)
+    bpy.utils.unregister_class(JumpToLinkGroupOperator)
+    bpy.utils.unregister_class(SelectCounterpartsOperator)
+    bpy.utils.unregister_class(RefreshLinkGroupSummaryOperator)
+    bpy.utils.unregister_class(LinkGroupList)
+    del bpy.types.WindowManager.link_group_summary
+    del bpy.types.WindowManager.link_group_summary_index
+    bpy.utils.unregister_class(LinkGroupSummaryItem)
     bpy.utils.unregister_class(CreateLinkedCollectionOperator)
     bpy.utils.unregister_class(SyncObjectsOperator)
     bpy.utils.unregister_class(RemoveSelectedObjectOperator)
@@ -790,6 +2195,18 @@ def unregister():
     bpy.utils.unregister_class(LinkedCollectionToolBoxPanel)
     bpy.utils.unregister_class(DisableSelectedInViewport)
     bpy.utils.unregister_class(SetOrigin)
+    bpy.utils.unregister_class(CreateLibraryLinkedCollectionOperator)
+    bpy.utils.unregister_class(SyncLibraryLinkGroupOperator)
+    bpy.utils.unregister_class(AuditLinkGroupsOperator)
+    bpy.utils.unregister_class(StoreLinkOverridesOperator)
+    bpy.utils.unregister_class(ClearLinkOverridesOperator)
+    bpy.utils.unregister_class(ApplyLinkOverridesOperator)
+    del bpy.types.Collection.link_overrides
+    bpy.utils.unregister_class(LinkedCollectionOverride)
+    bpy.app.handlers.load_post.remove(record_library_mtimes)
+    bpy.app.handlers.depsgraph_update_post.remove(record_new_library_mtimes)
+    if bpy.app.timers.is_registered(mark_library_mtimes_unknown):
+        bpy.app.timers.unregister(mark_library_mtimes_unknown)
 
 if __name__ == "__main__":
     register()